@@ -1,6 +1,11 @@
 import cv2
 import argparse
+import multiprocessing
 import os
+import queue
+import subprocess
+import sys
+import threading
 from collections import defaultdict
 import numpy as np
 
@@ -17,62 +22,202 @@ except ImportError:
     MLFLOW_AVAILABLE = False
     print("MLFlow not available. Install with: pip install mlflow")
 
+# Optional ffmpegcv import for hardware (NVENC) video encoding
+try:
+    import ffmpegcv
+
+    FFMPEGCV_AVAILABLE = True
+except ImportError:
+    FFMPEGCV_AVAILABLE = False
+
+
+class _MetricBuf:
+    # Growable typed buffer; avoids boxing a Python object per frame and
+    # hands smoothing a contiguous array without a list conversion
+    def __init__(self, dtype=np.float32):
+        self._arr = np.empty(1024, dtype=dtype)
+        self._n = 0
+
+    def append(self, value):
+        if self._n == len(self._arr):
+            self._grow(2 * len(self._arr))
+        self._arr[self._n] = value
+        self._n += 1
+
+    def extend(self, values):
+        values = np.asarray(values, dtype=self._arr.dtype)
+        needed = self._n + len(values)
+        if needed > len(self._arr):
+            capacity = len(self._arr)
+            while capacity < needed:
+                capacity *= 2
+            self._grow(capacity)
+        self._arr[self._n : needed] = values
+        self._n = needed
+
+    def _grow(self, capacity):
+        grown = np.empty(capacity, dtype=self._arr.dtype)
+        grown[: self._n] = self._arr[: self._n]
+        self._arr = grown
+
+    def values(self):
+        # Zero-copy view of the filled prefix
+        return self._arr[: self._n]
+
+    def __len__(self):
+        return self._n
+
 
 class FormDetector:
-    def __init__(self, exercise_type="bicep_curl", side="left", use_mlflow=False):
-        self.pose_detector = PoseDetector()
+    def __init__(
+        self,
+        exercise_type="bicep_curl",
+        side="left",
+        use_mlflow=False,
+        model_complexity=1,
+        min_tracking_confidence=0.5,
+        codec="mp4v",
+    ):
+        self.pose_detector = PoseDetector(
+            model_complexity=model_complexity,
+            min_tracking_confidence=min_tracking_confidence,
+        )
         self.posture_checker = PostureChecker()
         self.exercise_type = exercise_type
         self.side = side
         self.use_mlflow = use_mlflow and MLFLOW_AVAILABLE
-
-        # Storage for time-series data
-        self.metrics_history = defaultdict(list)
-        self.frame_results = []
-
-    def process_video(self, video_path, output_path=None, show_preview=True):
+        self.model_complexity = model_complexity
+        self.min_tracking_confidence = min_tracking_confidence
+        self.codec = codec
+
+        # Storage for time-series data; per-frame validity is kept as compact
+        # arrays rather than a dict per frame (see get_frame_results)
+        self.metrics_history = defaultdict(_MetricBuf)
+        self._metric_keys = {}
+        self._frame_nums = _MetricBuf(dtype=np.int32)
+        self._frame_valid = _MetricBuf(dtype=np.bool_)
+
+        # Static HUD title, rasterized once on first draw
+        self._hud_title = None
+        self._hud_mask = None
+
+    def process_video(
+        self,
+        video_path,
+        output_path=None,
+        show_preview=True,
+        analyze_fps=None,
+        start_frame=0,
+        end_frame=None,
+    ):
         # Open video
         cap = cv2.VideoCapture(video_path)
 
         if not cap.isOpened():
             raise ValueError(f"Could not open video file: {video_path}")
 
+        # Live sources buffer several frames internally; keep only the latest
+        # so form feedback is not lagging behind the camera
+        is_live = isinstance(video_path, int) or str(video_path).startswith("rtsp://")
+        if is_live:
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            if isinstance(video_path, int):
+                # MJPG uses much less USB bandwidth than raw webcam frames
+                cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
+
         # Get video properties
         fps = int(cap.get(cv2.CAP_PROP_FPS))
         frame_width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
         frame_height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
         total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
 
+        # Analyze every stride-th frame; the rest are grabbed but never decoded
+        stride = 1
+        if analyze_fps:
+            stride = max(1, int(fps // analyze_fps))
+
         print(f"Processing video: {video_path}")
         print(
             f"Resolution: {frame_width}x{frame_height}, FPS: {fps}, Frames: {total_frames}"
         )
+        if stride > 1:
+            print(f"Analyzing 1 in {stride} frames (~{fps / stride:.1f} FPS)")
 
         # Setup video writer if output path specified
         out = None
         if output_path:
-            fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-            out = cv2.VideoWriter(output_path, fourcc, fps, (frame_width, frame_height))
+            out = self._create_writer(output_path, fps, (frame_width, frame_height))
 
-        # Start MLFlow run
+        # Start MLFlow run; one batched call instead of a round-trip per key
         if self.use_mlflow:
             mlflow.start_run()
-            mlflow.log_param("video_path", video_path)
-            mlflow.log_param("exercise_type", self.exercise_type)
-            mlflow.log_param("side", self.side)
-            mlflow.log_param("fps", fps)
-            mlflow.log_param("total_frames", total_frames)
+            mlflow.log_params(
+                {
+                    "video_path": video_path,
+                    "exercise_type": self.exercise_type,
+                    "side": self.side,
+                    "fps": fps,
+                    "total_frames": total_frames,
+                }
+            )
 
-        frame_count = 0
+        frame_count = start_frame
+        analyzed_frames = 0
         valid_frames = 0
 
+        # Decode, inference and encode all release the GIL, so run them as a
+        # 3-stage pipeline: reader thread -> this thread (MediaPipe must stay
+        # on a single thread) -> writer thread
+        stop_event = threading.Event()
+        frame_queue = queue.Queue(maxsize=4)
+        reader = threading.Thread(
+            target=self._reader_loop,
+            args=(cap, frame_queue, stride, stop_event, start_frame, end_frame),
+            daemon=True,
+        )
+        write_queue = None
+        writer = None
+        if out:
+            write_queue = queue.Queue(maxsize=4)
+            writer = threading.Thread(
+                target=self._writer_loop, args=(out, write_queue, stride), daemon=True
+            )
+
+        # Preview gets its own thread so GUI paints never stall analysis;
+        # HighGUI is only touched when the preview is enabled
+        preview_queue = None
+        preview = None
+        if show_preview:
+            preview_queue = queue.Queue(maxsize=1)
+            preview = threading.Thread(
+                target=self._preview_loop, args=(preview_queue, stop_event), daemon=True
+            )
+
+        reader.start()
+        if writer:
+            writer.start()
+        if preview:
+            preview.start()
+
         try:
-            while cap.isOpened():
-                ret, frame = cap.read()
-                if not ret:
+            while True:
+                # Timed get so a stop request ('q' in the preview) is seen
+                # even while the frame queue is empty; the reader's sentinel
+                # is skipped once the stop event is set
+                try:
+                    item = frame_queue.get(timeout=0.1)
+                except queue.Empty:
+                    if stop_event.is_set():
+                        break
+                    continue
+
+                frame_count, frame = item
+                if frame is None:
+                    # EOF sentinel; frame_count is the grabbed-frame total,
+                    # including trailing frames that were never analyzed
                     break
 
-                frame_count += 1
+                analyzed_frames += 1
 
                 # Detect pose
                 results, landmarks = self.pose_detector.detect(frame)
@@ -82,67 +227,86 @@ class FormDetector:
 
                 # Check form if landmarks detected
                 feedback_text = []
-                if landmarks:
+                if landmarks is not None:
                     # Run posture checks
                     check_results = self.posture_checker.check_all(
                         landmarks, self.exercise_type, self.side
                     )
 
-                    # Store results
-                    self.frame_results.append(
-                        {
-                            "frame": frame_count,
-                            "valid": check_results["overall_valid"],
-                            "results": check_results,
-                        }
-                    )
+                    # Store per-frame validity compactly; the metrics below
+                    # already capture everything worth keeping per frame
+                    self._frame_nums.append(frame_count)
+                    self._frame_valid.append(check_results["overall_valid"])
 
                     if check_results["overall_valid"]:
                         valid_frames += 1
 
-                    # Collect metrics for time-series
+                    # Collect metrics for time-series; the combined key string
+                    # is built and interned once per (check, metric) pair
                     for check_name, check_data in check_results["checks"].items():
                         for metric_name, metric_value in check_data["metrics"].items():
-                            key = f"{check_name}_{metric_name}"
+                            key = self._metric_keys.get((check_name, metric_name))
+                            if key is None:
+                                key = sys.intern(f"{check_name}_{metric_name}")
+                                self._metric_keys[(check_name, metric_name)] = key
                             self.metrics_history[key].append(metric_value)
 
                     # Get feedback
                     feedback_text = check_results["all_feedback"]
                 else:
-                    feedback_text = ["No pose detected"]
+                    feedback_text = [{"text": "No pose detected", "ok": False}]
 
                 # Draw feedback on frame
                 self._draw_feedback(frame, feedback_text, frame_count, total_frames)
 
-                # Write frame to output
-                if out:
-                    out.write(frame)
+                # Hand the frame to the encode thread
+                if write_queue:
+                    write_queue.put(frame)
 
-                # Show preview
-                if show_preview:
-                    cv2.imshow("Form Detection", frame)
-                    if cv2.waitKey(1) & 0xFF == ord("q"):
-                        print("Preview stopped by user")
-                        break
+                # Show preview; drop the frame if the GUI thread is behind
+                if preview_queue:
+                    try:
+                        preview_queue.put_nowait(frame)
+                    except queue.Full:
+                        pass
+
+                # The preview thread sets the stop event on 'q'
+                if stop_event.is_set():
+                    break
 
                 # Progress
-                if frame_count % 30 == 0:
+                if analyzed_frames % 30 == 0:
                     print(f"Processed {frame_count}/{total_frames} frames...")
 
         finally:
-            # Cleanup
+            # Cleanup: stop the reader and preview, flush the writer
+            stop_event.set()
+            reader.join()
+            if preview:
+                preview.join()
+            if writer:
+                write_queue.put(None)
+                writer.join()
             cap.release()
             if out:
                 out.release()
-            cv2.destroyAllWindows()
             self.pose_detector.close()
 
+        return self._finalize_results(
+            video_path, frame_count - start_frame, analyzed_frames, valid_frames,
+            output_path,
+        )
+
+    def _finalize_results(
+        self, video_path, frame_count, analyzed_frames, valid_frames, output_path
+    ):
         # Calculate statistics
-        accuracy = (valid_frames / frame_count * 100) if frame_count > 0 else 0
+        accuracy = (valid_frames / analyzed_frames * 100) if analyzed_frames > 0 else 0
 
         # Smooth time-series data
         smoothed_metrics = {}
-        for key, values in self.metrics_history.items():
+        for key, buf in self.metrics_history.items():
+            values = buf.values()
             if len(values) > 5:
                 smoothed_metrics[key] = smooth_time_series(values)
             else:
@@ -153,29 +317,35 @@ class FormDetector:
             "exercise_type": self.exercise_type,
             "side": self.side,
             "total_frames": frame_count,
+            "analyzed_frames": analyzed_frames,
             "valid_frames": valid_frames,
             "accuracy": accuracy,
             "smoothed_metrics": smoothed_metrics,
-            "frame_results": self.frame_results,
+            "frame_results": self.get_frame_results(),
         }
 
-        # Log to MLFlow
+        # Log to MLFlow as a single batched call
         if self.use_mlflow:
-            mlflow.log_metric("total_frames_processed", frame_count)
-            mlflow.log_metric("valid_frames", valid_frames)
-            mlflow.log_metric("accuracy_percent", accuracy)
-
-            # Log average metrics
+            mlflow_metrics = {
+                "total_frames_processed": frame_count,
+                "analyzed_frames": analyzed_frames,
+                "valid_frames": valid_frames,
+                "accuracy_percent": accuracy,
+            }
+
+            # Average metrics
             for key, values in smoothed_metrics.items():
                 if len(values) > 0:
-                    mlflow.log_metric(f"avg_{key}", np.mean(values))
-                    mlflow.log_metric(f"std_{key}", np.std(values))
+                    mlflow_metrics[f"avg_{key}"] = float(np.mean(values))
+                    mlflow_metrics[f"std_{key}"] = float(np.std(values))
 
+            mlflow.log_metrics(mlflow_metrics)
             mlflow.end_run()
 
         print(f"\n{'='*50}")
         print(f"Analysis Complete!")
         print(f"Total Frames: {frame_count}")
+        print(f"Analyzed Frames: {analyzed_frames}")
         print(f"Valid Frames: {valid_frames}")
         print(f"Form Accuracy: {accuracy:.2f}%")
         print(f"{'='*50}\n")
@@ -185,23 +355,240 @@ class FormDetector:
 
         return results_summary
 
-    def _draw_feedback(self, frame, feedback_text, frame_num, total_frames):
-        # Draw semi-transparent background
-        overlay = frame.copy()
-        cv2.rectangle(
-            overlay, (10, 10), (600, 150 + len(feedback_text) * 30), (0, 0, 0), -1
+    def process_video_parallel(
+        self, video_path, output_path=None, workers=2, analyze_fps=None
+    ):
+        # Probe the video once for its properties
+        cap = cv2.VideoCapture(video_path)
+        if not cap.isOpened():
+            raise ValueError(f"Could not open video file: {video_path}")
+        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        cap.release()
+
+        workers = max(1, min(workers, total_frames))
+
+        # Partition into contiguous frame spans, one per worker process;
+        # each worker decodes only its own span
+        bounds = [total_frames * i // workers for i in range(workers + 1)]
+        segment_paths = [None] * workers
+        if output_path:
+            segment_paths = [f"{output_path}.part{i:02d}.mp4" for i in range(workers)]
+
+        tasks = [
+            (
+                video_path,
+                bounds[i],
+                bounds[i + 1],
+                segment_paths[i],
+                self.exercise_type,
+                self.side,
+                analyze_fps,
+                self.model_complexity,
+                self.min_tracking_confidence,
+                self.codec,
+            )
+            for i in range(workers)
+        ]
+
+        print(f"Processing video: {video_path} with {workers} worker processes")
+
+        if self.use_mlflow:
+            mlflow.start_run()
+            mlflow.log_params(
+                {
+                    "video_path": video_path,
+                    "exercise_type": self.exercise_type,
+                    "side": self.side,
+                    "total_frames": total_frames,
+                    "workers": workers,
+                }
+            )
+
+        # Spawn, not fork: this process already holds a MediaPipe graph with
+        # live XNNPACK/TFLite threads, and forked children deadlock on the
+        # mutexes they inherit from it
+        with multiprocessing.get_context("spawn").Pool(workers) as pool:
+            parts = pool.map(_process_span, tasks)
+
+        # Merge partial results in span order
+        frame_count = 0
+        analyzed_frames = 0
+        valid_frames = 0
+        for part in parts:
+            frame_count += part["total_frames"]
+            analyzed_frames += part["analyzed_frames"]
+            valid_frames += part["valid_frames"]
+            for key, values in part["metrics_history"].items():
+                self.metrics_history[key].extend(values)
+            self._frame_nums.extend(part["frame_nums"])
+            self._frame_valid.extend(part["frame_valid"])
+
+        if output_path and not self._concat_segments(segment_paths, output_path):
+            # No stitched file was produced; don't report one as saved
+            output_path = None
+
+        return self._finalize_results(
+            video_path, frame_count, analyzed_frames, valid_frames, output_path
         )
-        cv2.addWeighted(overlay, 0.6, frame, 0.4, 0, frame)
 
-        # Draw title
-        cv2.putText(
-            frame,
-            f"Exercise: {self.exercise_type.replace('_', ' ').title()} ({self.side})",
-            (20, 40),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            0.7,
-            (255, 255, 255),
-            2,
+    def get_frame_results(self):
+        # Materialize the per-frame dict list only when asked for it
+        return [
+            {"frame": int(num), "valid": bool(valid)}
+            for num, valid in zip(
+                self._frame_nums.values(), self._frame_valid.values()
+            )
+        ]
+
+    def _create_writer(self, output_path, fps, frame_size):
+        # Hardware NVENC encoding via ffmpegcv when requested and available;
+        # otherwise OpenCV's software mp4v writer (same .write/.release API)
+        if self.codec != "mp4v":
+            if FFMPEGCV_AVAILABLE:
+                try:
+                    return ffmpegcv.VideoWriterNV(output_path, self.codec, fps)
+                except Exception as e:
+                    print(f"Hardware encoder unavailable ({e}); falling back to mp4v")
+            else:
+                print("ffmpegcv not installed; falling back to mp4v")
+
+        fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+        return cv2.VideoWriter(output_path, fourcc, fps, frame_size)
+
+    @staticmethod
+    def _concat_segments(segment_paths, output_path):
+        # Stitch the per-worker segments losslessly with the ffmpeg concat
+        # demuxer; fall back to keeping the segments when ffmpeg is missing
+        list_path = f"{output_path}.segments.txt"
+        with open(list_path, "w") as f:
+            for path in segment_paths:
+                f.write(f"file '{os.path.abspath(path)}'\n")
+
+        try:
+            subprocess.run(
+                [
+                    "ffmpeg", "-y", "-loglevel", "error",
+                    "-f", "concat", "-safe", "0",
+                    "-i", list_path, "-c", "copy", output_path,
+                ],
+                check=True,
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"Could not concatenate segments ({e}); segments kept as-is:")
+            for path in segment_paths:
+                print(f"  {path}")
+            return False
+        finally:
+            os.remove(list_path)
+
+        for path in segment_paths:
+            os.remove(path)
+        return True
+
+    @staticmethod
+    def _queue_put(item_queue, item, stop_event):
+        # Blocking put that gives up when the pipeline is shutting down
+        while not stop_event.is_set():
+            try:
+                item_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _reader_loop(self, cap, frame_queue, stride, stop_event, start_frame, end_frame):
+        # Decode thread: grab every frame, decode only the analyzed ones
+        if start_frame:
+            # OpenCV seeks to the nearest earlier keyframe and decodes
+            # forward, so at most one partial GOP is paid per span
+            cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
+
+        frame_count = start_frame
+        while not stop_event.is_set() and cap.isOpened():
+            if end_frame is not None and frame_count >= end_frame:
+                break
+
+            if not cap.grab():
+                break
+
+            frame_count += 1
+
+            if (frame_count - start_frame - 1) % stride != 0:
+                continue
+
+            ret, frame = cap.retrieve()
+            if not ret:
+                break
+
+            if not self._queue_put(frame_queue, (frame_count, frame), stop_event):
+                break
+
+        # Sentinel signals EOF to the analysis thread and reports how many
+        # frames were actually grabbed, which with a stride > 1 can exceed
+        # the index of the last analyzed frame
+        self._queue_put(frame_queue, (frame_count, None), stop_event)
+
+    @staticmethod
+    def _preview_loop(preview_queue, stop_event):
+        # GUI thread: imshow/waitKey run here so event processing never
+        # blocks the analysis loop
+        while not stop_event.is_set():
+            try:
+                frame = preview_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            cv2.imshow("Form Detection", frame)
+            if cv2.waitKey(1) & 0xFF == ord("q"):
+                print("Preview stopped by user")
+                stop_event.set()
+                break
+
+        cv2.destroyAllWindows()
+
+    @staticmethod
+    def _writer_loop(out, write_queue, stride):
+        # Encode thread: hold each annotated frame for stride output frames
+        # so the written video keeps the source frame rate
+        while True:
+            frame = write_queue.get()
+            if frame is None:
+                break
+            for _ in range(stride):
+                out.write(frame)
+
+    def _draw_feedback(self, frame, feedback_text, frame_num, total_frames):
+        # Darken only the overlay box instead of blending two full-frame
+        # copies; 0.6*black + 0.4*roi is identical to the old result
+        box_h = 150 + len(feedback_text) * 30
+        frame_h, frame_w = frame.shape[:2]
+        roi = frame[10 : min(10 + box_h, frame_h), 10 : min(610, frame_w)]
+        dark = np.zeros_like(roi)
+        cv2.addWeighted(dark, 0.6, roi, 0.4, 0, roi)
+
+        # Rasterize the invariant title once; FreeType work per frame is
+        # then just the counter and feedback lines
+        if self._hud_title is None:
+            strip = np.zeros((40, 600, 3), dtype=np.uint8)
+            cv2.putText(
+                strip,
+                f"Exercise: {self.exercise_type.replace('_', ' ').title()} ({self.side})",
+                (10, 30),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                0.7,
+                (255, 255, 255),
+                2,
+            )
+            self._hud_title = strip
+            self._hud_mask = strip.any(axis=2, keepdims=True)
+
+        # Stamp the pre-rendered title over the darkened box
+        strip_h = min(40, max(0, frame_h - 10))
+        strip_w = min(600, max(0, frame_w - 10))
+        np.copyto(
+            frame[10 : 10 + strip_h, 10 : 10 + strip_w],
+            self._hud_title[:strip_h, :strip_w],
+            where=self._hud_mask[:strip_h, :strip_w],
         )
 
         # Draw frame counter
@@ -215,13 +602,13 @@ class FormDetector:
             1,
         )
 
-        # Draw feedback
+        # Draw feedback; each entry carries its own ok flag, no string scanning
         y_offset = 100
-        for i, text in enumerate(feedback_text):
-            color = (0, 255, 0) if "Good form" in text else (0, 165, 255)
+        for i, item in enumerate(feedback_text):
+            color = (0, 255, 0) if item["ok"] else (0, 165, 255)
             cv2.putText(
                 frame,
-                text,
+                item["text"],
                 (20, y_offset + i * 30),
                 cv2.FONT_HERSHEY_SIMPLEX,
                 0.5,
@@ -230,6 +617,51 @@ class FormDetector:
             )
 
 
+def _process_span(args):
+    # Worker process: analyze the [start_frame, end_frame) span of the video
+    (
+        video_path,
+        start_frame,
+        end_frame,
+        segment_path,
+        exercise_type,
+        side,
+        analyze_fps,
+        model_complexity,
+        min_tracking_confidence,
+        codec,
+    ) = args
+
+    detector = FormDetector(
+        exercise_type=exercise_type,
+        side=side,
+        use_mlflow=False,
+        model_complexity=model_complexity,
+        min_tracking_confidence=min_tracking_confidence,
+        codec=codec,
+    )
+    summary = detector.process_video(
+        video_path,
+        output_path=segment_path,
+        show_preview=False,
+        analyze_fps=analyze_fps,
+        start_frame=start_frame,
+        end_frame=end_frame,
+    )
+
+    return {
+        "start_frame": start_frame,
+        "total_frames": summary["total_frames"],
+        "analyzed_frames": summary["analyzed_frames"],
+        "valid_frames": summary["valid_frames"],
+        "metrics_history": {
+            key: buf.values() for key, buf in detector.metrics_history.items()
+        },
+        "frame_nums": detector._frame_nums.values(),
+        "frame_valid": detector._frame_valid.values(),
+    }
+
+
 def main():
     parser = argparse.ArgumentParser(description="Exercise Form Correctness Detection")
     parser.add_argument("video", type=str, help="Path to video file")
@@ -250,6 +682,38 @@ def main():
     parser.add_argument(
         "--output", type=str, default=None, help="Path to save output video"
     )
+    parser.add_argument(
+        "--analyze-fps",
+        type=float,
+        default=None,
+        help="Analyze at this rate; intermediate frames are skipped without decoding",
+    )
+    parser.add_argument(
+        "--codec",
+        type=str,
+        default="mp4v",
+        choices=["mp4v", "h264", "hevc"],
+        help="Output codec; h264/hevc use NVENC hardware encoding via ffmpegcv",
+    )
+    parser.add_argument(
+        "--complexity",
+        type=int,
+        default=1,
+        choices=[0, 1, 2],
+        help="MediaPipe model complexity; 0 (Lite) is ~2x faster than 1 (Full)",
+    )
+    parser.add_argument(
+        "--tracking-confidence",
+        type=float,
+        default=0.5,
+        help="Minimum tracking confidence before re-running detection",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes for offline analysis (disables preview)",
+    )
     parser.add_argument(
         "--no-preview", action="store_true", help="Disable real-time preview"
     )
@@ -269,14 +733,30 @@ def main():
 
     # Create detector
     detector = FormDetector(
-        exercise_type=args.exercise, side=args.side, use_mlflow=args.mlflow
+        exercise_type=args.exercise,
+        side=args.side,
+        use_mlflow=args.mlflow,
+        model_complexity=args.complexity,
+        min_tracking_confidence=args.tracking_confidence,
+        codec=args.codec,
     )
 
     # Process video
     try:
-        results = detector.process_video(
-            args.video, output_path=args.output, show_preview=not args.no_preview
-        )
+        if args.workers > 1:
+            results = detector.process_video_parallel(
+                args.video,
+                output_path=args.output,
+                workers=args.workers,
+                analyze_fps=args.analyze_fps,
+            )
+        else:
+            results = detector.process_video(
+                args.video,
+                output_path=args.output,
+                show_preview=not args.no_preview,
+                analyze_fps=args.analyze_fps,
+            )
 
         print("\nDetection completed successfully!")
 
@@ -20,12 +20,20 @@ class PoseDetector:
             min_tracking_confidence=min_tracking_confidence,
         )
 
+        # Reusable (33, 4) buffer: x, y, z, visibility per landmark
+        self._landmark_arr = np.empty((33, 4), dtype=np.float32)
+        # Reusable destination for the BGR->RGB conversion
+        self._rgb = None
+
     def detect(self, frame):
-        # Convert BGR to RGB
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        # Convert BGR to RGB into a preallocated buffer instead of
+        # allocating a fresh frame-sized array every call
+        if self._rgb is None or self._rgb.shape != frame.shape:
+            self._rgb = np.empty_like(frame)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb)
 
         # Process the frame
-        results = self.pose.process(frame_rgb)
+        results = self.pose.process(self._rgb)
 
         # Extract landmarks
         landmarks = None
@@ -36,55 +44,17 @@ class PoseDetector:
 
     def _extract_landmarks(self, pose_landmarks, frame_shape):
         h, w, _ = frame_shape
-        landmarks = {}
-
-        # MediaPipe Pose landmark indices
-        landmark_names = {
-            0: "nose",
-            1: "left_eye_inner",
-            2: "left_eye",
-            3: "left_eye_outer",
-            4: "right_eye_inner",
-            5: "right_eye",
-            6: "right_eye_outer",
-            7: "left_ear",
-            8: "right_ear",
-            9: "mouth_left",
-            10: "mouth_right",
-            11: "left_shoulder",
-            12: "right_shoulder",
-            13: "left_elbow",
-            14: "right_elbow",
-            15: "left_wrist",
-            16: "right_wrist",
-            17: "left_pinky",
-            18: "right_pinky",
-            19: "left_index",
-            20: "right_index",
-            21: "left_thumb",
-            22: "right_thumb",
-            23: "left_hip",
-            24: "right_hip",
-            25: "left_knee",
-            26: "right_knee",
-            27: "left_ankle",
-            28: "right_ankle",
-            29: "left_heel",
-            30: "right_heel",
-            31: "left_foot_index",
-            32: "right_foot_index",
-        }
 
-        for idx, landmark in enumerate(pose_landmarks.landmark):
-            name = landmark_names.get(idx, f"landmark_{idx}")
-            landmarks[name] = {
-                "x": landmark.x * w,
-                "y": landmark.y * h,
-                "z": landmark.z,
-                "visibility": landmark.visibility,
-            }
+        # Fill the preallocated buffer in one pass, then scale the
+        # normalized x/y columns to pixel coordinates vectorized
+        arr = self._landmark_arr
+        arr[:] = [
+            (lm.x, lm.y, lm.z, lm.visibility) for lm in pose_landmarks.landmark
+        ]
+        arr[:, 0] *= w
+        arr[:, 1] *= h
 
-        return landmarks
+        return arr
 
     def draw_landmarks(self, frame, results):
         if results.pose_landmarks:
@@ -1,37 +1,156 @@
-import numpy as np
-from scipy.signal import savgol_filter
-
+import math
+from functools import lru_cache
 
-def calculate_angle(point1, point2, point3):
-    # point2 is the vertex
-    x1, y1 = point1
-    x2, y2 = point2
-    x3, y3 = point3
-
-    # Calculate vectors
-    vector1 = np.array([x1 - x2, y1 - y2])
-    vector2 = np.array([x3 - x2, y3 - y2])
+import numpy as np
 
-    # Calculate angle using dot product
-    dot_product = np.dot(vector1, vector2)
-    magnitude1 = np.linalg.norm(vector1)
-    magnitude2 = np.linalg.norm(vector2)
+# Optional Numba import
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        # Fall back to the plain Python functions when numba is missing
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+
+        return wrap
+
+# MediaPipe Pose landmark names, ordered by landmark id
+LANDMARK_NAMES = (
+    "nose",
+    "left_eye_inner",
+    "left_eye",
+    "left_eye_outer",
+    "right_eye_inner",
+    "right_eye",
+    "right_eye_outer",
+    "left_ear",
+    "right_ear",
+    "mouth_left",
+    "mouth_right",
+    "left_shoulder",
+    "right_shoulder",
+    "left_elbow",
+    "right_elbow",
+    "left_wrist",
+    "right_wrist",
+    "left_pinky",
+    "right_pinky",
+    "left_index",
+    "right_index",
+    "left_thumb",
+    "right_thumb",
+    "left_hip",
+    "right_hip",
+    "left_knee",
+    "right_knee",
+    "left_ankle",
+    "right_ankle",
+    "left_heel",
+    "right_heel",
+    "left_foot_index",
+    "right_foot_index",
+)
+
+LANDMARK_INDEX = {name: idx for idx, name in enumerate(LANDMARK_NAMES)}
+
+# Integer ids for the landmarks used by the posture checks
+LEFT_SHOULDER = 11
+RIGHT_SHOULDER = 12
+LEFT_ELBOW = 13
+RIGHT_ELBOW = 14
+LEFT_WRIST = 15
+RIGHT_WRIST = 16
+LEFT_HIP = 23
+RIGHT_HIP = 24
+
+
+@njit(cache=True, fastmath=True)
+def calculate_angle(x1, y1, x2, y2, x3, y3):
+    # (x2, y2) is the vertex; pure scalar math so numba can compile it
+    vx1 = x1 - x2
+    vy1 = y1 - y2
+    vx2 = x3 - x2
+    vy2 = y3 - y2
+
+    dot_product = vx1 * vx2 + vy1 * vy2
+    magnitude1 = math.sqrt(vx1 * vx1 + vy1 * vy1)
+    magnitude2 = math.sqrt(vx2 * vx2 + vy2 * vy2)
 
     # Avoid division by zero
     if magnitude1 == 0 or magnitude2 == 0:
-        return 0
+        return 0.0
 
     cos_angle = dot_product / (magnitude1 * magnitude2)
-    cos_angle = np.clip(cos_angle, -1.0, 1.0)  # Clip to avoid numerical errors
-    angle = np.arccos(cos_angle)
-
-    return np.degrees(angle)
-
-
-def calculate_distance(point1, point2):
-    x1, y1 = point1
-    x2, y2 = point2
-    return np.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+    # Clip to avoid numerical errors
+    if cos_angle < -1.0:
+        cos_angle = -1.0
+    elif cos_angle > 1.0:
+        cos_angle = 1.0
+
+    return math.degrees(math.acos(cos_angle))
+
+
+@njit(cache=True, fastmath=True)
+def calculate_distance(x1, y1, x2, y2):
+    return math.hypot(x2 - x1, y2 - y1)
+
+
+@njit(cache=True, fastmath=True)
+def compute_frame_features(landmarks, left_side):
+    # All per-frame geometry for the posture checks in one compiled pass
+    # over the (33, 4) landmark array; one call per frame instead of a
+    # Python/numpy dispatch per angle, distance and symmetry.
+    if left_side:
+        sh, el, wr = LEFT_SHOULDER, LEFT_ELBOW, LEFT_WRIST
+    else:
+        sh, el, wr = RIGHT_SHOULDER, RIGHT_ELBOW, RIGHT_WRIST
+
+    shx, shy = landmarks[sh, 0], landmarks[sh, 1]
+    elx, ely = landmarks[el, 0], landmarks[el, 1]
+    wrx, wry = landmarks[wr, 0], landmarks[wr, 1]
+
+    # Arm features for the analyzed side
+    arm_angle = calculate_angle(shx, shy, elx, ely, wrx, wry)
+    elbow_shoulder_dist = calculate_distance(elx, ely, shx, shy)
+    wrist_shoulder_vertical = abs(wry - shy)
+    horizontal_dist = abs(wrx - shx)
+
+    # Back-posture features
+    lsx, lsy = landmarks[LEFT_SHOULDER, 0], landmarks[LEFT_SHOULDER, 1]
+    rsx, rsy = landmarks[RIGHT_SHOULDER, 0], landmarks[RIGHT_SHOULDER, 1]
+    lhx, lhy = landmarks[LEFT_HIP, 0], landmarks[LEFT_HIP, 1]
+    rhx, rhy = landmarks[RIGHT_HIP, 0], landmarks[RIGHT_HIP, 1]
+
+    smx = (lsx + rsx) / 2
+    smy = (lsy + rsy) / 2
+    hmx = (lhx + rhx) / 2
+    hmy = (lhy + rhy) / 2
+
+    shoulder_height_diff = abs(lsy - rsy)
+    hip_height_diff = abs(lhy - rhy)
+
+    spine_angle = calculate_angle(smx, smy - 100, smx, smy, hmx, hmy)
+    shoulder_symmetry = calculate_symmetry(lsx, lsy, rsx, rsy, smx, smy)
+    hip_symmetry = calculate_symmetry(lhx, lhy, rhx, rhy, hmx, hmy)
+
+    return (
+        arm_angle,
+        elbow_shoulder_dist,
+        wrist_shoulder_vertical,
+        horizontal_dist,
+        spine_angle,
+        shoulder_height_diff,
+        hip_height_diff,
+        shoulder_symmetry,
+        hip_symmetry,
+    )
 
 
 def calculate_vertical_alignment(point1, point2, threshold=20):
@@ -46,42 +165,59 @@ def calculate_horizontal_alignment(point1, point2, threshold=20):
     return abs(y2 - y1) < threshold
 
 
-def calculate_symmetry(left_point, right_point, center_point):
-    left_dist = calculate_distance(left_point, center_point)
-    right_dist = calculate_distance(right_point, center_point)
+@njit(cache=True, fastmath=True)
+def calculate_symmetry(left_x, left_y, right_x, right_y, center_x, center_y):
+    left_dist = calculate_distance(left_x, left_y, center_x, center_y)
+    right_dist = calculate_distance(right_x, right_y, center_x, center_y)
 
     if left_dist + right_dist == 0:
-        return 0
+        return 0.0
+
+    return abs(left_dist - right_dist) / (left_dist + right_dist)
 
-    symmetry = abs(left_dist - right_dist) / (left_dist + right_dist)
-    return symmetry
+
+# Savitzky-Golay coefficients for the default window=5, polyorder=2, written
+# out so the common path never has to import SciPy at all
+_SG5 = np.array([-3.0, 12.0, 17.0, 12.0, -3.0], dtype=np.float32) / 35.0
+
+
+@lru_cache(maxsize=None)
+def _savgol_kernel(window_length, polyorder):
+    # Smoothing (deriv=0) coefficients are symmetric, so they can be applied
+    # directly with np.convolve
+    if (window_length, polyorder) == (5, 2):
+        return _SG5
+
+    # Deferred: importing SciPy costs a good fraction of a second at startup
+    from scipy.signal import savgol_coeffs
+
+    return savgol_coeffs(window_length, polyorder)
 
 
 def smooth_time_series(data, window_length=5, polyorder=2):
     if len(data) < window_length:
-        return np.array(data)
+        return np.asarray(data, dtype=np.float32)
 
     # Ensure window_length is odd
     if window_length % 2 == 0:
         window_length += 1
 
-    return savgol_filter(data, window_length, polyorder)
+    # Savitzky-Golay as a single convolution with precomputed coefficients;
+    # skips SciPy's per-call validation and coefficient solve
+    kernel = _savgol_kernel(window_length, polyorder)
+    return np.convolve(np.asarray(data, dtype=np.float32), kernel, mode="same")
 
 
-def get_landmark_coords(landmarks, name):
-    if landmarks is None or name not in landmarks:
+def get_landmark_coords(landmarks, index):
+    if landmarks is None:
         return None
 
-    landmark = landmarks[name]
-    return (landmark["x"], landmark["y"])
+    # Landmarks are a (33, 4) array; row index by id, columns are x, y
+    return landmarks[index, :2]
 
 
-def check_visibility(landmarks, names, threshold=0.5):
+def check_visibility(landmarks, indices, threshold=0.5):
     if landmarks is None:
         return False
 
-    for name in names:
-        if name not in landmarks or landmarks[name]["visibility"] < threshold:
-            return False
-
-    return True
+    return bool((landmarks[list(indices), 3] >= threshold).all())